@@ -12,9 +12,86 @@ License: MIT, see LICENSE
 
 # pyright: reportUnusedImport=false
 
-from prc import exceptions
-from prc.models import *
+from typing import TYPE_CHECKING, Any, List
+import importlib
 
-from prc.client import PRC
-from prc.server import Server
-from prc.webhooks import Webhooks
+if TYPE_CHECKING:
+    from prc import exceptions
+    from prc.models import *
+
+    from prc.client import PRC
+    from prc.server import Server
+    from prc.webhooks import Webhooks
+
+# Exports are imported on first access. Model names mirror `prc.models.__all__`
+# (keep both lists in sync, see tests/exports.py) so unknown attributes fail
+# without importing anything.
+_MODELS = (
+    "ServerStatus",
+    "AccountRequirement",
+    "ServerPlayer",
+    "QueuedPlayer",
+    "ServerOwner",
+    "StaffMember",
+    "PlayerPermission",
+    "ServerTeam",
+    "PlayerLocation",
+    "Vehicle",
+    "VehicleName",
+    "VehicleModel",
+    "VehicleOwner",
+    "VehicleTexture",
+    "VehicleColor",
+    "LogEntry",
+    "LogPlayer",
+    "AccessType",
+    "AccessEntry",
+    "KillEntry",
+    "CommandEntry",
+    "ModCallEntry",
+    "ServerStaff",
+    "Player",
+    "Command",
+    "CommandArg",
+    "CommandName",
+    "FireType",
+    "Weather",
+    "CommandTarget",
+    "WebhookPlayer",
+    "WebhookType",
+    "WebhookMessage",
+    "WebhookVersion",
+    "BasePlayer",
+    "PartialServerPlayer",
+    "CallPlayer",
+    "CallLocation",
+    "EmergencyCallEntry",
+    "Location",
+)
+
+_LAZY = {
+    "exceptions": "prc.exceptions",
+    "models": "prc.models",
+    "PRC": "prc.client",
+    "Server": "prc.server",
+    "Webhooks": "prc.webhooks",
+    **dict.fromkeys(_MODELS, "prc.models"),
+}
+
+__all__ = ["exceptions", "PRC", "Server", "Webhooks", *_MODELS]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(module_name)
+    value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
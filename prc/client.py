@@ -5,17 +5,31 @@ The main prc.api client.
 """
 
 from .utility import KeylessCache, Cache, CacheConfig, Requests, CacheSweeper
-from .utility.requests import CleanAsyncClient
-from typing import Optional, TYPE_CHECKING
+from .utility.requests import CleanAsyncClient, AiohttpTransport, json_loads
+from typing import Literal, Optional, TYPE_CHECKING
+from functools import lru_cache
 from .exceptions import HTTPException
 from .webhooks import Webhooks
 from .server import Server
-import re
 
 if TYPE_CHECKING:
     from prc import Player
 
 
+@lru_cache(maxsize=128)
+def _parse_server_key(server_key: str) -> str:
+    prefix, _, server_id = server_key.partition("-")
+    if not (
+        prefix.isascii()
+        and prefix.isalnum()
+        and server_id.isascii()
+        and server_id.isalnum()
+    ):
+        raise ValueError(f"Invalid server-key format: {server_key}")
+
+    return server_id
+
+
 class GlobalCache:
     """
     Global object caches and config. TTL in seconds, 0 to disable. (max_size, TTL)
@@ -32,7 +46,7 @@ class GlobalCache:
         self.servers = Cache[str, Server](sweeper, *servers)
         self.join_codes = Cache[str, str](sweeper, *join_codes)
         self.players = Cache[int, "Player"](sweeper, *players)
-        self.invalid_keys = KeylessCache[str](sweeper, *invalid_keys)
+        self.invalid_keys = KeylessCache[str](sweeper, *invalid_keys, key=lambda k: k)
 
 
 class PRC:
@@ -45,15 +59,21 @@ class PRC:
         The global authentication key (large scale apps), if any.
     default_server_key
         The default unique server key to use. This will allow you to use `get_server` without needing to pass a key.
+    http_backend
+        The HTTP library used to send requests. `aiohttp` may perform better under many concurrent requests but must be installed separately (`pip install prc.api[aiohttp]`). Defaults to `httpx`.
     """
 
     def __init__(
         self,
         global_key: Optional[str] = None,
         default_server_key: Optional[str] = None,
+        http_backend: Literal["httpx", "aiohttp"] = "httpx",
         _base_url: str = "https://api.erlc.gg",
         _cache: Optional[GlobalCache] = None,
     ):
+        if http_backend not in ("httpx", "aiohttp"):
+            raise ValueError(f"Invalid HTTP backend: {http_backend}")
+
         self._global_key = global_key
         if default_server_key:
             self._validate_server_key(default_server_key)
@@ -63,7 +83,9 @@ class PRC:
         self._global_cache = (
             _cache if _cache is not None else GlobalCache(sweeper=self._cache_sweeper)
         )
-        self._session = CleanAsyncClient()
+        self._session = CleanAsyncClient(
+            transport=AiohttpTransport() if http_backend == "aiohttp" else None
+        )
         self._key_requests = (
             Requests(
                 base_url=self._base_url + "/v1/api-key",
@@ -104,8 +126,7 @@ class PRC:
         if not server_key:
             raise ValueError("No [default] server-key provided but is required")
 
-        self._validate_server_key(server_key)
-        server_id = self._get_server_id(server_key)
+        server_id = self._validate_server_key(server_key)
 
         existing_server = self._global_cache.servers.get(server_id)
         if existing_server:
@@ -138,6 +159,19 @@ class PRC:
                 ),
             )
 
+    async def aclose(self) -> None:
+        """
+        Close the client's shared HTTP session. Requests can no longer be sent by this client or its servers.
+        """
+
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "PRC":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
+
     async def reset_key(self) -> str:
         """
         Reset the global key and generate a new one. The new key will be applied automatically and will be returned.
@@ -150,7 +184,7 @@ class PRC:
         response = await self._key_requests.post("/reset")
 
         if response.is_success:
-            new_key: str = response.json()["new"]
+            new_key: str = json_loads(response.content)["new"]
 
             for server_id, server in self._global_cache.servers.items():
                 server._global_key = new_key
@@ -171,18 +205,8 @@ class PRC:
                 response,
             )
 
-    def _get_player(self, id: Optional[int] = None, name: Optional[str] = None):
-        for _, player in self._global_cache.players.items():
-            if id and player.id == id:
-                return player
-            if name and player.name == name:
-                return player
-
-    def _validate_server_key(self, server_key: str):
-        expression = r"^[a-z0-9]+\-[a-z0-9]+$"
-        if not re.match(expression, server_key, re.IGNORECASE):
-            raise ValueError(f"Invalid server-key format: {server_key}")
-
-    def _get_server_id(self, server_key: str):
-        parsed_key = server_key.split("-")
-        return parsed_key[1]
+    def _get_player(self, id: int):
+        return self._global_cache.players.get(id)
+
+    def _validate_server_key(self, server_key: str) -> str:
+        return _parse_server_key(server_key)
@@ -9,7 +9,7 @@ class BasePlayer:
     Base class from which all player classes inherit.
     """
 
-    pass
+    __slots__ = ()
 
 
 class Player(BasePlayer):
@@ -24,30 +24,37 @@ class Player(BasePlayer):
         The player name and ID. Either a tuple or default response format (`PlayerName:123`).
     """
 
+    __slots__ = ("_client", "id", "name")
+
     id: int
     name: str
 
     def __init__(
         self,
         client: "PRC",
-        data: Union[str, Tuple[str, str]],
+        data: Union[str, Tuple[Union[str, int], str]],
         _skip_cache: Optional[bool] = False,
     ):
         self._client = client
 
         if isinstance(data, str):
-            if "remote server" in data.lower():
+            if data[:13].lower() == "remote server":
                 id, name = ("0", "Remote Server")
             else:
-                name, id = data.split(":")
+                name, sep, id = data.rpartition(":")
+                if not sep:
+                    raise ValueError(f"A malformed player was received: {data}")
         else:
-            id, name = [*data]
+            id, name = data
 
-        if not id.isdigit():
+        if isinstance(id, int):
+            self.id = id
+        elif id.isdigit():
+            self.id = int(id)
+        else:
             raise ValueError(f"A malformed player ID was received: {data}")
 
-        self.id = int(id)
-        self.name = str(name)
+        self.name = name
 
         if not self.is_remote() and not _skip_cache:
             client._global_cache.players.set(self.id, self)
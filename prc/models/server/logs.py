@@ -10,7 +10,6 @@ from ..player import Player
 
 if TYPE_CHECKING:
     from prc.server import Server
-    from prc.utility import KeylessCache
     from prc.api_types.v2 import (
         v2_ServerJoinLog,
         v2_ServerKillLog,
@@ -28,11 +27,9 @@ class LogEntry:
     ----------
     data
         The response data.
-    cache
-        The corresponding initialized cache, if any.
     """
 
-    created_at: datetime
+    __slots__ = ("_created_at",)
 
     def __init__(
         self,
@@ -43,7 +40,6 @@ class LogEntry:
             "v2_ServerModCall",
             "v2_ServerEmergencyCall",
         ],
-        cache: Optional["KeylessCache"] = None,
     ):
         time = data.get("Timestamp", data.get("StartedAt", None))
         if not time:
@@ -51,23 +47,24 @@ class LogEntry:
                 "Log entry unexpectedly has neither a timestamp nor a start time"
             )
 
-        self.created_at = datetime.fromtimestamp(time)
+        self._created_at = time
 
-        if cache is not None:
-            for entry in cache.items():
-                if entry.created_at == self.created_at:
-                    break
-            else:
-                cache.add(self)
+    @property
+    def created_at(self) -> datetime:
+        """
+        When this log entry was created.
+        """
+
+        return datetime.fromtimestamp(self._created_at)
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, LogEntry) and self.created_at == other.created_at
+        return isinstance(other, LogEntry) and self._created_at == other._created_at
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __gt__(self, other: "LogEntry") -> bool:
-        return isinstance(other, LogEntry) and self.created_at > other.created_at
+        return isinstance(other, LogEntry) and self._created_at > other._created_at
 
     def __ge__(self, other: "LogEntry") -> bool:
         return self.__gt__(other) or self.__eq__(other)
@@ -91,16 +88,31 @@ class LogPlayer(Player, PartialServerPlayer):
         The player name and ID (`PlayerName:123`).
     """
 
+    __slots__ = ("_server", "_value", "_player", "_players_version")
+
     def __init__(self, server: "Server", data: str):
         self._server = server
 
         super().__init__(client=server._client, data=data)
         self._value = self.id
+        self._players_version = -1
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id={self.id}, name={self.name}>"
 
 
+def _get_log_player(server: "Server", data: str) -> LogPlayer:
+    player = server._server_cache.log_players.get(data)
+    if player is None:
+        player = server._server_cache.log_players.set(
+            data, LogPlayer(server, data=data)
+        )
+    elif not player.is_remote():
+        # keep the reused player fresh in the global players cache
+        server._client._global_cache.players.set(player.id, player)
+    return player
+
+
 class CallPlayer(PartialServerPlayer):
     """
     Represents a server partial player referenced in a call entry.
@@ -113,6 +125,8 @@ class CallPlayer(PartialServerPlayer):
         The player ID.
     """
 
+    __slots__ = ("_server", "_value", "_player", "_players_version", "id")
+
     id: int
 
     def __init__(self, server: "Server", id: int):
@@ -174,12 +188,15 @@ class AccessType(Enum):
 
     @staticmethod
     def parse(value: bool) -> "AccessType":
-        return AccessType.JOIN if value else AccessType.LEAVE
+        return _ACCESS_FROM_BOOL[bool(value)]
 
     JOIN = 0
     LEAVE = 1
 
 
+_ACCESS_FROM_BOOL = (AccessType.LEAVE, AccessType.JOIN)
+
+
 class AccessEntry(LogEntry):
     """
     Represents a server access (join/leave) log entry.
@@ -192,16 +209,24 @@ class AccessEntry(LogEntry):
         The response data.
     """
 
+    __slots__ = ("_server", "type", "subject")
+
     type: AccessType
     subject: LogPlayer
 
     def __init__(self, server: "Server", data: "v2_ServerJoinLog"):
         self._server = server
 
-        self.type = AccessType.parse(bool(data["Join"]))
-        self.subject = LogPlayer(server, data=data["Player"])
+        self.type = _ACCESS_FROM_BOOL[bool(data["Join"])]
+        self.subject = _get_log_player(server, data["Player"])
 
-        super().__init__(data, cache=server._server_cache.access_logs)
+        super().__init__(data)
+
+        if self.is_join():
+            joins = server._server_cache.player_joins
+            last_join = joins.peek(self.subject.id)
+            if last_join is None or self._created_at > last_join._created_at:
+                joins.set(self.subject.id, self)
 
     def is_join(self) -> bool:
         """
@@ -233,14 +258,16 @@ class KillEntry(LogEntry):
         The response data.
     """
 
+    __slots__ = ("_server", "killer", "killed")
+
     killer: LogPlayer
     killed: LogPlayer
 
     def __init__(self, server: "Server", data: "v2_ServerKillLog"):
         self._server = server
 
-        self.killer = LogPlayer(server, data=data["Killer"])
-        self.killed = LogPlayer(server, data=data["Killed"])
+        self.killer = _get_log_player(server, data["Killer"])
+        self.killed = _get_log_player(server, data["Killed"])
 
         super().__init__(data)
 
@@ -260,13 +287,15 @@ class CommandEntry(LogEntry):
         The response data.
     """
 
+    __slots__ = ("_server", "author", "command")
+
     author: LogPlayer
     command: Command
 
     def __init__(self, server: "Server", data: "v2_ServerCommandLog"):
         self._server = server
 
-        self.author = LogPlayer(server, data=data["Player"])
+        self.author = _get_log_player(server, data["Player"])
         self.command = Command(data=data["Command"], author=self.author, server=server)
 
         super().__init__(data)
@@ -287,15 +316,17 @@ class ModCallEntry(LogEntry):
         The response data.
     """
 
+    __slots__ = ("_server", "caller", "responder")
+
     caller: LogPlayer
     responder: Optional[LogPlayer]
 
     def __init__(self, server: "Server", data: "v2_ServerModCall"):
         self._server = server
 
-        self.caller = LogPlayer(server, data=data["Caller"])
+        self.caller = _get_log_player(server, data["Caller"])
         responder = data.get("Moderator", None)
-        self.responder = LogPlayer(server, data=responder) if responder else None
+        self.responder = _get_log_player(server, responder) if responder else None
 
         super().__init__(data)
 
@@ -322,6 +353,16 @@ class EmergencyCallEntry(LogEntry):
         The response data.
     """
 
+    __slots__ = (
+        "_server",
+        "team",
+        "caller",
+        "responders",
+        "location",
+        "call_number",
+        "description",
+    )
+
     team: ServerTeam
     caller: Optional[CallPlayer]
     responders: List[CallPlayer]
@@ -1,4 +1,14 @@
-from typing import List, Literal, Optional, Tuple, TYPE_CHECKING, Union, cast, overload
+from typing import (
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+    cast,
+    overload,
+)
 from .shared import Location, ServerTeam
 from prc.utility import DisplayNameEnum
 from ..player import BasePlayer, Player
@@ -24,19 +34,22 @@ class PlayerPermission(DisplayNameEnum):
     __hierarchy__: List[int] = [
         p[0] for p in [NORMAL, HELPER, MOD, ADMIN, CO_OWNER, OWNER]
     ]
+    __ranks__: Dict[int, int] = {v: i for i, v in enumerate(__hierarchy__)}
 
     def __gt__(self, other: Union[int, "PlayerPermission"]) -> bool:
         if isinstance(other, PlayerPermission):
             other = other.value
-        return other in self.__hierarchy__ and (
-            self.__hierarchy__.index(self.value) > self.__hierarchy__.index(other)
-        )
+        ranks = self.__ranks__
+        return other in ranks and ranks[self.value] > ranks[other]
 
     def __ge__(self, other: Union[int, "PlayerPermission"]) -> bool:
         return self.__gt__(other) or self.__eq__(other)
 
     def __lt__(self, other: Union[int, "PlayerPermission"]) -> bool:
-        return not self.__gt__(other)
+        if isinstance(other, PlayerPermission):
+            other = other.value
+        ranks = self.__ranks__
+        return other in ranks and ranks[self.value] < ranks[other]
 
     def __le__(self, other: Union[int, "PlayerPermission"]) -> bool:
         return self.__lt__(other) or self.__eq__(other)
@@ -69,6 +82,20 @@ class PlayerLocation(Location):
         return f"<{self.__class__.__name__} coordinates={self.coordinates}, street_name={self.street_name}, postal_code={self.postal_code}>"
 
 
+def _get_server_player(
+    player: Union["PartialServerPlayer", "StaffMember"],
+    *,
+    id: Optional[int] = None,
+    name: Optional[str] = None,
+) -> Optional["ServerPlayer"]:
+    # the server player is looked up again only after the server players are refreshed
+    server_cache = player._server._server_cache
+    if player._players_version != server_cache.players_version:
+        player._player = player._server._get_player(id=id, name=name)
+        player._players_version = server_cache.players_version
+    return player._player
+
+
 class PartialServerPlayer(BasePlayer):
     """
     Represents a partial server player with either a name or an ID.
@@ -81,9 +108,12 @@ class PartialServerPlayer(BasePlayer):
         The player data value. Either a name or an ID.
     """
 
+    __slots__ = ()
+
     def __init__(self, server: "Server", value: Union[str, int]):
         self._server = server
         self._value = value
+        self._players_version = -1
 
     @property
     def player(self) -> Optional["ServerPlayer"]:
@@ -92,10 +122,12 @@ class PartialServerPlayer(BasePlayer):
         """
 
         if isinstance(self._value, int):
-            return self._server._get_player(id=self._value)
-        return self._server._get_player(name=self._value)
+            return _get_server_player(self, id=self._value)
+        return _get_server_player(self, name=self._value)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, PartialServerPlayer):
             return self._value == other._value
         elif isinstance(other, Player):
@@ -121,6 +153,15 @@ class ServerPlayer(Player):
         The response data.
     """
 
+    __slots__ = (
+        "_server",
+        "permission",
+        "callsign",
+        "team",
+        "location",
+        "wanted_stars",
+    )
+
     permission: PlayerPermission
     callsign: Optional[str]
     team: ServerTeam
@@ -138,9 +179,6 @@ class ServerPlayer(Player):
 
         super().__init__(server._client, data=data["Player"])
 
-        if not self.is_remote():
-            server._server_cache.players.set(self.id, self)
-
         if self.permission == PlayerPermission.OWNER:
             server.owner = ServerOwner(server, self.id, self.permission)
 
@@ -150,14 +188,8 @@ class ServerPlayer(Player):
         When this player last joined the server. Server access (join/leave) logs must be fetched separately.
         """
 
-        return next(
-            (
-                entry.created_at
-                for entry in self._server._server_cache.access_logs.items()
-                if entry.subject.id == self.id and entry.is_join()
-            ),
-            None,
-        )
+        last_join = self._server._server_cache.player_joins.peek(self.id)
+        return last_join.created_at if last_join else None
 
     @property
     def vehicle(self) -> Optional["Vehicle"]:
@@ -185,8 +217,14 @@ class ServerPlayer(Player):
         The player's spawned vehicles. Each player can have up to 2 spawned vehicles (1 primary and 1 secondary). Server vehicles must be fetched separately.
         """
 
+        vehicles = self._server._server_cache.vehicles
         return [
-            v for v in self._server._server_cache.vehicles.items() if v.owner == self
+            vehicle
+            for vehicle in (
+                vehicles.get_by_key((self.name, False)),
+                vehicles.get_by_key((self.name, True)),
+            )
+            if vehicle is not None
         ]
 
     def is_staff(self, include_helpers: bool = True) -> bool:
@@ -332,6 +370,8 @@ class QueuedPlayer(BasePlayer):
         The player's queue list index.
     """
 
+    __slots__ = ("_server", "id", "spot")
+
     id: int
     spot: int
 
@@ -377,6 +417,8 @@ class ServerOwner(PartialServerPlayer):
         The player ID.
     """
 
+    __slots__ = ("_server", "_value", "_player", "_players_version", "id", "permission")
+
     id: int
     permission: PlayerPermission
 
@@ -409,12 +451,15 @@ class StaffMember(Player):
         The player permission.
     """
 
+    __slots__ = ("_server", "_player", "_players_version", "permission")
+
     permission: PlayerPermission
 
     def __init__(
         self, server: "Server", data: Tuple[str, str], permission: PlayerPermission
     ):
         self._server = server
+        self._players_version = -1
 
         self.permission = permission
 
@@ -426,7 +471,7 @@ class StaffMember(Player):
         The full server player, if found.
         """
 
-        return self._server._get_player(id=self.id)
+        return _get_server_player(self, id=self.id)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name}, id={self.id}, permission={self.permission}>"
@@ -48,7 +48,7 @@ class ServerStaff:
             StaffMember(server, data=player, permission=PlayerPermission.HELPER)
             for player in server._parse_api_map(data["Helpers"]).items()
         ]
-        server.mods = self.mods
+        server.helpers = self.helpers
 
         server.total_staff_count = self.count()
 
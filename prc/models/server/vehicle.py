@@ -1,4 +1,14 @@
-from typing import Optional, Literal, TYPE_CHECKING, cast, List
+from typing import (
+    FrozenSet,
+    Optional,
+    Literal,
+    TYPE_CHECKING,
+    Tuple,
+    cast,
+    List,
+)
+from functools import lru_cache
+import sys
 
 from .player import PartialServerPlayer
 
@@ -19,15 +29,20 @@ class VehicleOwner(PartialServerPlayer):
         The player name.
     """
 
+    __slots__ = ("_server", "_value", "_player", "_players_version", "name")
+
     name: str
 
     def __init__(self, server: "Server", name: str):
         self._server = server
 
-        self.name = str(name)
+        self.name = sys.intern(str(name))
 
         super().__init__(server, value=self.name)
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name}>"
 
@@ -77,6 +92,8 @@ class VehicleTexture:
         The vehicle texture's name.
     """
 
+    __slots__ = ("name",)
+
     name: str
 
     def __init__(self, name: str):
@@ -109,6 +126,9 @@ class VehicleTexture:
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     def __str__(self) -> str:
         return self.name
 
@@ -128,11 +148,23 @@ class Vehicle:
         The response data.
     """
 
+    __slots__ = (
+        "_server",
+        "owner",
+        "texture",
+        "color",
+        "model",
+        "year",
+        "plate",
+        "_full_name",
+        "_is_secondary",
+    )
+
     owner: VehicleOwner
     texture: VehicleTexture
     color: Optional[VehicleColor]
     model: "VehicleModel"
-    year: Optional[int] = None
+    year: Optional[int]
     plate: str
 
     def __init__(self, server: "Server", data: "v2_ServerVehicle"):
@@ -148,20 +180,13 @@ class Vehicle:
         ):
             self.color = VehicleColor(name=color_name, hex=color_hex)
 
-        self.model = cast(VehicleModel, data["Name"])
-
-        parsed_name = self.model.split(" ")
-        for i in [0, -1]:
-            if parsed_name[i].isdigit() and len(parsed_name[i]) == 4:
-                year = int(parsed_name.pop(i))
-                if 2100 >= year >= 1900:
-                    self.year = year
-                    self.model = cast(VehicleModel, " ".join(parsed_name))
-
-        for i, v in enumerate(server._server_cache.vehicles.items()):
-            if v.owner == self.owner and v.is_secondary() == self.is_secondary():
-                server._server_cache.vehicles.remove(i)
-        server._server_cache.vehicles.add(self)
+        name = data["Name"]
+        model, self.year = _parse_vehicle_name(name)
+        self.model = cast(VehicleModel, sys.intern(model))
+        self._full_name = cast(
+            VehicleName, sys.intern(f"{self.year or ''} {self.model}".strip())
+        )
+        self._is_secondary = self._full_name in _secondary_vehicles
 
     @property
     def full_name(self) -> "VehicleName":
@@ -169,14 +194,14 @@ class Vehicle:
         The vehicle model name suffixed by the model year (if applicable). Unique for each *game* vehicle. A *server* may have multiple spawned vehicles with the same full name.
         """
 
-        return cast(VehicleName, f"{self.year or ''} {self.model}".strip())
+        return self._full_name
 
     def is_secondary(self) -> bool:
         """
         Whether this is the vehicle owner's secondary vehicle. Secondary vehicles include ATVs, UTVs, the lawn mower and such.
         """
 
-        return self.full_name in _secondary_vehicles
+        return self._is_secondary
 
     def is_prestige(self) -> bool:
         """
@@ -186,15 +211,20 @@ class Vehicle:
         return self.model in _prestige_vehicles
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         return (
             isinstance(other, Vehicle)
-            and (self.full_name == other.full_name)
+            and (self._full_name == other._full_name)
             and (self.owner == other.owner)
         )
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash((self._full_name, self.owner.name))
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.full_name}, owner={self.owner.name}, color={self.color}, texture={self.texture}, plate={self.plate}>"
 
@@ -686,46 +716,65 @@ VehicleModel = Literal[
     "Vinnimade Heavy Wrecker",
 ]
 
-_secondary_vehicles: List[VehicleName] = [
-    "4-Wheeler",
-    "Canyon Descender",
-    "Forklift",
-    "Lawn Mower",
-]
-
-_prestige_vehicles: List[VehicleModel] = [
-    "Averon LM R",
-    "Averon LM",
-    "Averon Q8",
-    "Averon RS3",
-    "Averon S5",
-    "BKM Munich",
-    "Chevlon Corbeta 1M Edition",
-    "Chevlon Corbeta 8",
-    "Chevlon Corbeta RZR",
-    "Chevlon Corbeta X08",
-    "Falcon Heritage Track",
-    "Falcon Heritage",
-    "Ferdinand Jalapeno Turbo",
-    "Ferrari F8 Tributo",
-    "Leland LTS5-V Blackwing",
-    "Leland Vault",
-    "Silhouette Carbon",
-    "Strugatti Ettore",
-    "Stuttgart Vierturig",
-    "Surrey 650S",
-    "Takeo Experience",
-    "Terrain Traveller",
-]
-
-_fictional_textures = [
-    "Standard",
-    "Ghost",
-    "SWAT",
-    "Supervisor",
-]
-
-_default_textures = [
-    *_fictional_textures,
-    "Undercover",
-]
+_secondary_vehicles: FrozenSet[VehicleName] = frozenset(
+    {
+        "4-Wheeler",
+        "Canyon Descender",
+        "Forklift",
+        "Lawn Mower",
+    }
+)
+
+_prestige_vehicles: FrozenSet[VehicleModel] = frozenset(
+    {
+        "Averon LM R",
+        "Averon LM",
+        "Averon Q8",
+        "Averon RS3",
+        "Averon S5",
+        "BKM Munich",
+        "Chevlon Corbeta 1M Edition",
+        "Chevlon Corbeta 8",
+        "Chevlon Corbeta RZR",
+        "Chevlon Corbeta X08",
+        "Falcon Heritage Track",
+        "Falcon Heritage",
+        "Ferdinand Jalapeno Turbo",
+        "Ferrari F8 Tributo",
+        "Leland LTS5-V Blackwing",
+        "Leland Vault",
+        "Silhouette Carbon",
+        "Strugatti Ettore",
+        "Stuttgart Vierturig",
+        "Surrey 650S",
+        "Takeo Experience",
+        "Terrain Traveller",
+    }
+)
+
+_fictional_textures: FrozenSet[str] = frozenset(
+    {
+        "Standard",
+        "Ghost",
+        "SWAT",
+        "Supervisor",
+    }
+)
+
+_default_textures: FrozenSet[str] = _fictional_textures | {"Undercover"}
+
+
+# Vehicle names are a small, fixed set; each is parsed once on first use
+@lru_cache(maxsize=256)
+def _parse_vehicle_name(name: str) -> Tuple["VehicleModel", Optional[int]]:
+    model, year = name, None
+
+    parsed_name = name.split(" ")
+    for i in [0, -1]:
+        if parsed_name[i].isdigit() and len(parsed_name[i]) == 4:
+            parsed_year = int(parsed_name.pop(i))
+            if 2100 >= parsed_year >= 1900:
+                year = parsed_year
+                model = " ".join(parsed_name)
+
+    return cast(VehicleModel, model), year
@@ -27,13 +27,14 @@ class WebhookPlayer(Player):
         The server handler, if any.
     """
 
+    __slots__ = ("_server",)
+
     def __init__(
         self,
         client: "PRC",
         data: Tuple[str, str],
         server: Optional["Server"] = None,
     ):
-        self._client = client
         self._server = server
 
         super().__init__(client, data=data)
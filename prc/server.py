@@ -21,6 +21,7 @@ from .utility import (
     InsensitiveEnum,
     CacheSweeper,
 )
+from .utility.requests import json_loads
 from .models import PlayerList, ServerPlayerList, QueuedPlayerList, VehicleList
 from functools import wraps
 from .exceptions import *
@@ -41,6 +42,26 @@ R = TypeVar("R")
 M = TypeVar("M")
 LOG = TypeVar("LOG")
 
+# API error code -> exception type
+_API_EXCEPTIONS: Dict[int, Callable[..., APIException]] = {
+    exception().code: exception
+    for exception in (
+        UnknownError,
+        CommunicationError,
+        InternalError,
+        InvalidServerKey,
+        InvalidGlobalKey,
+        BannedServerKey,
+        InvalidCommand,
+        ServerOffline,
+        RateLimited,
+        RestrictedCommand,
+        ProhibitedMessage,
+        RestrictedResource,
+        OutOfDateModule,
+    )
+}
+
 
 class ServerCache:
     """
@@ -53,12 +74,22 @@ class ServerCache:
         players: CacheConfig = (50, 0),
         vehicles: CacheConfig = (100, 1.0 * 60 * 60),
         access_logs: CacheConfig = (150, 6.0 * 60 * 60),
+        log_players: CacheConfig = (150, 0),
     ):
         self.players = Cache[int, ServerPlayer](sweeper, *players)
-        self.vehicles = KeylessCache[Vehicle](sweeper, *vehicles)
+        self.player_names = Cache[str, int](sweeper, *players, unique=False)
+        self.players_version = 0
+        self.vehicles = KeylessCache[Vehicle](
+            sweeper, *vehicles, key=lambda v: (v.owner.name, v.is_secondary())
+        )
         self.access_logs = KeylessCache[AccessEntry](
-            sweeper, *access_logs, sort=(lambda e: e.created_at, True)
+            sweeper,
+            *access_logs,
+            sort=(lambda e: e._created_at, True),
+            key=lambda e: (e._created_at, e.subject.id),
         )
+        self.player_joins = Cache[int, AccessEntry](sweeper, *access_logs)
+        self.log_players = Cache[str, LogPlayer](sweeper, *log_players)
 
 
 def _refresh_server(func):
@@ -72,6 +103,8 @@ def _refresh_server(func):
 
 
 def _ephemeral(func):
+    name = func.__name__
+
     @wraps(func)
     async def wrapper(self: "Server", *args, **kwargs):
         cache: Optional[Cache] = getattr(self, "_ephemeral_cache", None)
@@ -85,17 +118,22 @@ def _ephemeral(func):
                 setattr(self, "_ephemeral_cache", cache)
             cache.ttl = self._ephemeral_ttl or 1.0
 
+            # hashable arguments are used as-is, others are serialized and hashed
+            cache_key: Any = (name, args, tuple(sorted(kwargs.items())))
             try:
-                args_repr = json.dumps(args, sort_keys=True, default=str)
-                kwargs_repr = json.dumps(kwargs, sort_keys=True, default=str)
-            except (TypeError, ValueError):
-                args_repr = str(args)
-                kwargs_repr = str(kwargs)
-
-            hashed_args = hashlib.sha256(
-                f"{args_repr}|{kwargs_repr}".encode()
-            ).hexdigest()
-            cache_key = f"{func.__name__}_cache_{hashed_args}"
+                hash(cache_key)
+            except TypeError:
+                try:
+                    args_repr = json.dumps(args, sort_keys=True, default=str)
+                    kwargs_repr = json.dumps(kwargs, sort_keys=True, default=str)
+                except (TypeError, ValueError):
+                    args_repr = str(args)
+                    kwargs_repr = str(kwargs)
+
+                hashed_args = hashlib.sha256(
+                    f"{args_repr}|{kwargs_repr}".encode()
+                ).hexdigest()
+                cache_key = f"{name}_cache_{hashed_args}"
 
             if entry := cache.get(cache_key):
                 return copy.copy(entry)
@@ -148,7 +186,12 @@ class ServerQuery(ServerStatus):
 
         if ((_players := data.get("Players"))) is not None:
             server._server_cache.players.clear()
+            server._server_cache.player_names.clear()
+            server._server_cache.players_version += 1
             players = ServerPlayerList(ServerPlayer(server, data=p) for p in _players)
+            cached = [p for p in players if not p.is_remote()]
+            server._server_cache.players.set_many((p.id, p) for p in cached)
+            server._server_cache.player_names.set_many((p.name, p.id) for p in cached)
             server.staff_count = len([p for p in players if p.is_staff()])
             self.players = players
 
@@ -163,28 +206,26 @@ class ServerQuery(ServerStatus):
             self.queue = queue
 
         if ((access_logs := data.get("JoinLogs"))) is not None:
-            for e in access_logs:
-                AccessEntry(server, data=e)
+            server._server_cache.access_logs.add_many(
+                AccessEntry(server, data=e) for e in access_logs
+            )
             self.access_logs = server.logs._sort(
                 server._server_cache.access_logs.items(), oldest_first
             )
 
         if ((kill_logs := data.get("KillLogs"))) is not None:
             self.kill_logs = server.logs._sort(
-                [KillEntry(server, data=e) for e in kill_logs],
-                oldest_first,
+                [KillEntry(server, data=e) for e in kill_logs], oldest_first
             )
 
         if ((command_logs := data.get("CommandLogs"))) is not None:
             self.command_logs = server.logs._sort(
-                [CommandEntry(server, data=e) for e in command_logs],
-                oldest_first,
+                [CommandEntry(server, data=e) for e in command_logs], oldest_first
             )
 
         if ((mod_calls := data.get("ModCalls"))) is not None:
             self.mod_calls = server.logs._sort(
-                [ModCallEntry(server, data=e) for e in mod_calls],
-                oldest_first,
+                [ModCallEntry(server, data=e) for e in mod_calls], oldest_first
             )
 
         if ((emergency_calls := data.get("EmergencyCalls"))) is not None:
@@ -195,7 +236,12 @@ class ServerQuery(ServerStatus):
 
         if ((vehicles := data.get("Vehicles"))) is not None:
             server._server_cache.vehicles.clear()
-            self.vehicles = VehicleList(Vehicle(server, data=v) for v in vehicles)
+            # replaces each owner's cached vehicle of the same kind (primary/secondary)
+            self.vehicles = VehicleList(
+                server._server_cache.vehicles.add_many(
+                    Vehicle(server, data=v) for v in vehicles
+                )
+            )
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} name={self.name}, owner={self.owner.id}, join_code={self.join_code}>"
@@ -232,27 +278,33 @@ class Server:
     ):
         self._client = client
 
-        client._validate_server_key(server_key)
-        self._id = client._get_server_id(server_key)
+        self._id = client._validate_server_key(server_key)
 
         self._global_cache = client._global_cache
-        self._server_cache = cache or ServerCache(sweeper=client._cache_sweeper)
+        self._server_cache = (
+            cache if cache is not None else ServerCache(sweeper=client._cache_sweeper)
+        )
         self._ephemeral_ttl = ephemeral_ttl
 
         self._global_key = client._global_key
         self._server_key = server_key
         self._ignore_global_key = ignore_global_key
-        self._requests = requests or self._refresh_requests()
+        self._requests = requests if requests is not None else self._refresh_requests()
+
+        self.co_owners = []
+        self.admins = []
+        self.mods = []
+        self.helpers = []
 
         self.logs = ServerLogs(self)
         self.commands = ServerCommands(self)
 
     name: Optional[str] = None
     owner: Optional[ServerOwner] = None
-    co_owners: List[ServerOwner] = []
-    admins: List[StaffMember] = []
-    mods: List[StaffMember] = []
-    helpers: List[StaffMember] = []
+    co_owners: List[ServerOwner]
+    admins: List[StaffMember]
+    mods: List[StaffMember]
+    helpers: List[StaffMember]
     total_staff_count: Optional[int] = None
     player_count: Optional[int] = None
     staff_count: Optional[int] = None
@@ -322,11 +374,14 @@ class Server:
     def _get_player(
         self, *, id: Optional[int] = None, name: Optional[str] = None
     ) -> Optional[ServerPlayer]:
-        for _, player in self._server_cache.players.items():
-            if id and player.id == id:
-                return player
-            if name and player.name == name:
-                return player
+        if id is not None:
+            return self._server_cache.players.get(id)
+        if name is not None:
+            player_id = self._server_cache.player_names.get(name)
+            if player_id is not None:
+                player = self._server_cache.players.get(player_id)
+                if player and player.name == name:
+                    return player
 
     def _raise_error_code(self, content: Any, response: httpx.Response) -> NoReturn:
         if not isinstance(content, Dict):
@@ -342,44 +397,28 @@ class Server:
                 response,
             )
 
-        exceptions: List[Callable[..., APIException]] = [
-            UnknownError,
-            CommunicationError,
-            InternalError,
-            InvalidServerKey,
-            InvalidGlobalKey,
-            BannedServerKey,
-            InvalidCommand,
-            ServerOffline,
-            RateLimited,
-            RestrictedCommand,
-            ProhibitedMessage,
-            RestrictedResource,
-            OutOfDateModule,
-        ]
-
-        for _exception in exceptions:
-            exception = _exception()
-            if error_code == exception.code:
-                invalid_key = None
-                if isinstance(exception, InvalidGlobalKey):
-                    invalid_key = self._global_key
-                elif isinstance(exception, (InvalidServerKey, BannedServerKey)):
-                    invalid_key = self._server_key
-
-                if invalid_key:
-                    self._global_cache.invalid_keys.add(invalid_key)
-
-                if isinstance(exception, RateLimited):
-                    exception = RateLimited(
-                        content.get("bucket"), content.get("retry_after")
-                    )
+        exception_type = _API_EXCEPTIONS.get(error_code)
+        if exception_type is not None:
+            invalid_key = None
+            if exception_type is InvalidGlobalKey:
+                invalid_key = self._global_key
+            elif exception_type in (InvalidServerKey, BannedServerKey):
+                invalid_key = self._server_key
+
+            if invalid_key:
+                self._global_cache.invalid_keys.add(invalid_key)
 
-                if isinstance(exception, (CommunicationError, ServerOffline)):
-                    exception = _exception(command_id=content.get("commandId"))
+            if exception_type is RateLimited:
+                exception = RateLimited(
+                    content.get("bucket"), content.get("retry_after")
+                )
+            elif exception_type in (CommunicationError, ServerOffline):
+                exception = exception_type(command_id=content.get("commandId"))
+            else:
+                exception = exception_type()
 
-                exception.response = response
-                raise exception
+            exception.response = response
+            raise exception
 
         raise APIException(
             error_code,
@@ -392,9 +431,10 @@ class Server:
         if not content_type or not content_type.startswith("application/json"):
             raise PRCException(f"Received a non-json content type: '{content_type}'")
 
+        content = json_loads(response.content)
         if not response.is_success:
-            self._raise_error_code(response.json(), response)
-        return response.json()
+            self._raise_error_code(content, response)
+        return content
 
     @_refresh_server
     @_ephemeral
@@ -622,7 +662,7 @@ class ServerLogs(ServerModule):
 
     def _sort(self, logs: Sequence[LOG], oldest_first: bool = False) -> List[LOG]:
         return sorted(
-            logs, key=lambda x: getattr(x, "created_at"), reverse=not oldest_first
+            logs, key=lambda x: getattr(x, "_created_at"), reverse=not oldest_first
         )
 
     @_refresh_server
@@ -754,6 +794,24 @@ T = TypeVar("T")
 OneOrMany = Union[T, Sequence[T]]
 
 
+def _parse_command_arg(
+    arg: Union[CommandArg, CommandTargetPlayerNameOrId], prefer_player_id: bool
+) -> str:
+    if isinstance(arg, Player):
+        if prefer_player_id:
+            return str(arg.id)
+        return str(arg.name)
+
+    if isinstance(arg, (QueuedPlayer, ServerOwner)):
+        return str(arg.id)
+    if isinstance(arg, VehicleOwner):
+        return str(arg.name)
+    if isinstance(arg, InsensitiveEnum):
+        return arg.value
+
+    return str(arg)
+
+
 class ServerCommands(ServerModule):
     """
     Interact with the PRC ER:LC server remote command execution API.
@@ -804,45 +862,20 @@ class ServerCommands(ServerModule):
 
         parts = [f":{name}"]
 
-        def parse_target(target: CommandTargetPlayerNameOrId):
-            if isinstance(target, Player):
-                if _prefer_player_id:
-                    return str(target.id)
-                return str(target.name)
-
-            elif isinstance(targets, (QueuedPlayer, ServerOwner)):
-                return str(targets.id)
-            elif isinstance(targets, VehicleOwner):
-                return str(targets.name)
-
-            elif isinstance(targets, (str, int)):
-                return str(targets)
-
-            return str(target)
-
         if targets:
             if isinstance(targets, Sequence) and not isinstance(targets, str):
-                parts.append(",".join([parse_target(t) for t in targets]))
+                parts.append(
+                    ",".join(
+                        [_parse_command_arg(t, _prefer_player_id) for t in targets]
+                    )
+                )
             else:
-                parts.append(parse_target(targets))
-
-        def parse_arg(arg: Union[CommandArg, CommandTargetPlayerNameOrId]):
-            if isinstance(arg, Player):
-                if _prefer_player_id:
-                    return str(arg.id)
-                return str(arg.name)
-
-            if isinstance(arg, (QueuedPlayer, ServerOwner)):
-                return str(arg.id)
-            if isinstance(arg, VehicleOwner):
-                return str(arg.name)
-            if isinstance(arg, InsensitiveEnum):
-                return arg.value
-
-            return str(arg)
+                parts.append(_parse_command_arg(targets, _prefer_player_id))
 
         if args:
-            parts.append(" ".join([parse_arg(a) for a in args]))
+            parts.append(
+                " ".join([_parse_command_arg(a, _prefer_player_id) for a in args])
+            )
 
         if text:
             parts.append(text)
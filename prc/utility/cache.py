@@ -1,6 +1,16 @@
-from typing import Dict, Generic, Optional, TypeVar, Tuple, List, Callable, Any, Deque
-from collections import OrderedDict, deque
-from time import time
+from typing import (
+    Dict,
+    Generic,
+    Optional,
+    TypeVar,
+    Tuple,
+    List,
+    Callable,
+    Any,
+    Iterable,
+)
+from collections import OrderedDict
+from time import monotonic
 import asyncio
 import weakref
 
@@ -69,59 +79,94 @@ class Cache(Generic[K, V]):
 
         self._cache: "OrderedDict[K, V]" = OrderedDict()
         self._timestamps: Dict[K, float] = {}
+        # id(value) -> key, used to enforce value uniqueness
+        self._value_keys: Dict[int, K] = {}
 
         sweeper.register(self)
 
     def _is_expired(self, key: K, now: Optional[float] = None) -> bool:
         if self.ttl is None:
             return False
-        now = now if now is not None else time()
+        now = now if now is not None else monotonic()
         return now - self._timestamps.get(key, 0) > self.ttl
 
     def _delete_oversize(self) -> None:
         while len(self._cache) > self.max_size:
-            oldest_key, _ = self._cache.popitem(last=False)
+            oldest_key, oldest_value = self._cache.popitem(last=False)
             self._timestamps.pop(oldest_key, None)
+            if self.unique:
+                self._value_keys.pop(id(oldest_value), None)
+
+    def _index_value(self, key: K, value: V) -> None:
+        previous_key = self._value_keys.get(id(value))
+        if previous_key is not None and previous_key != key:
+            self.delete(previous_key)
+        previous_value = self._cache.get(key)
+        if previous_value is not None and previous_value is not value:
+            self._value_keys.pop(id(previous_value), None)
+        self._value_keys[id(value)] = key
 
     def set(self, key: K, value: V) -> V:
-        now = time()
+        now = monotonic()
         if self.unique:
-            to_remove = [k for k, v in self._cache.items() if v is value and k != key]
-            for k in to_remove:
-                self._cache.pop(k, None)
-                self._timestamps.pop(k, None)
-        if key in self._cache:
-            self._cache.move_to_end(key)
+            self._index_value(key, value)
         self._cache[key] = value
+        self._cache.move_to_end(key)
         self._timestamps[key] = now
         if len(self._cache) > self.max_size:
             self._delete_oversize()
         return value
 
+    def set_many(self, items: Iterable[Tuple[K, V]]) -> None:
+        now = monotonic()
+        for key, value in items:
+            if self.unique:
+                self._index_value(key, value)
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            self._timestamps[key] = now
+        if len(self._cache) > self.max_size:
+            self._delete_oversize()
+
     def get(self, key: K) -> Optional[V]:
-        now = time()
-        if key in self._cache:
-            if not self._is_expired(key, now):
-                self._cache.move_to_end(key)
-                self._timestamps[key] = now
-                return self._cache[key]
-            else:
-                self.delete(key)
-        return None
+        try:
+            value = self._cache[key]
+        except KeyError:
+            return None
+
+        now = monotonic()
+        if self.ttl is not None and now - self._timestamps[key] > self.ttl:
+            self.delete(key)
+            return None
+
+        self._cache.move_to_end(key)
+        self._timestamps[key] = now
+        return value
+
+    # like `get`, but does not refresh the TTL or LRU position
+    def peek(self, key: K) -> Optional[V]:
+        value = self._cache.get(key)
+        if value is not None and self._is_expired(key):
+            self.delete(key)
+            return None
+        return value
 
     def delete(self, key: K) -> None:
-        self._cache.pop(key, None)
+        value = self._cache.pop(key, None)
         self._timestamps.pop(key, None)
+        if value is not None and self.unique:
+            self._value_keys.pop(id(value), None)
 
     def clear(self) -> None:
-        self._cache.clear()
-        self._timestamps.clear()
+        self._cache = OrderedDict()
+        self._timestamps = {}
+        self._value_keys = {}
 
     def cleanup(self, max_items: int = 50) -> int:
         if self.ttl is None:
             return 0
 
-        now = time()
+        now = monotonic()
         removed = 0
 
         for key in list(self._cache.keys()):
@@ -133,18 +178,24 @@ class Cache(Generic[K, V]):
 
         return removed
 
-    def items(self) -> List[Tuple[K, V]]:
-        now = time()
-        expired = [k for k in self._cache if self._is_expired(k, now)]
+    def _delete_expired(self) -> None:
+        if self.ttl is None:
+            return
+
+        cutoff = monotonic() - self.ttl
+        expired = [k for k, ts in self._timestamps.items() if ts < cutoff]
         for k in expired:
             self.delete(k)
+
+    def items(self) -> List[Tuple[K, V]]:
+        self._delete_expired()
         return list(self._cache.items())
 
     def __len__(self) -> int:
         return len(self._cache)
 
     def __contains__(self, key: K) -> bool:
-        now = time()
+        now = monotonic()
         if key in self._cache and not self._is_expired(key, now):
             return True
         return False
@@ -157,100 +208,112 @@ class KeylessCache(Generic[V]):
         max_size: int = 100,
         ttl: Optional[float] = None,
         sort: Optional[Tuple[Callable[[V], Any], Optional[bool]]] = None,
+        key: Optional[Callable[[V], Any]] = None,
     ):
         """
-        A custom keyless cache class with size limitation and TTL. Items are unique.
+        A custom keyless cache class with size limitation and TTL. Items are unique by identity, or by `key` when set.
         """
 
         self.max_size = max_size
         self.ttl = ttl or None
         self._sort = sort
+        self._key: Callable[[V], Any] = key if key is not None else id
 
-        self._cache: Deque[V] = deque()
-        self._timestamps: Deque[float] = deque()
+        self._cache: "OrderedDict[Any, Tuple[V, float]]" = OrderedDict()
+        # sorted values, rebuilt on read after the cache changes
+        self._view: Optional[List[V]] = None
 
         sweeper.register(self)
 
-    def _is_expired(self, index: int, now: Optional[float] = None) -> bool:
+    def _is_expired(self, timestamp: float, now: Optional[float] = None) -> bool:
         if self.ttl is None:
             return False
-        now = now if now is not None else time()
-        return now - self._timestamps[index] > self.ttl
+        now = now if now is not None else monotonic()
+        return now - timestamp > self.ttl
 
     def _delete_oversize(self) -> None:
         while len(self._cache) > self.max_size:
-            self._cache.popleft()
-            self._timestamps.popleft()
-
-    def _sort_cache(self) -> None:
-        if self._sort is not None and self._cache:
-            key_func, reverse = self._sort
-            combined = list(zip(self._cache, self._timestamps))
-            combined.sort(key=lambda x: key_func(x[0]), reverse=(reverse or False))
-            self._cache = deque([x[0] for x in combined])
-            self._timestamps = deque([x[1] for x in combined])
+            self._cache.popitem(last=False)
 
     def add(self, value: V) -> V:
-        now = time()
-        try:
-            idx = next(i for i, v in enumerate(self._cache) if v is value)
-            self._timestamps[idx] = now
-        except StopIteration:
-            if len(self._cache) >= self.max_size:
-                self._delete_oversize()
-            self._cache.append(value)
-            self._timestamps.append(now)
-        self._sort_cache()
+        key = self._key(value)
+        self._cache[key] = (value, monotonic())
+        self._cache.move_to_end(key)
+        self._view = None
+        if len(self._cache) > self.max_size:
+            self._delete_oversize()
         return value
 
+    def add_many(self, values: Iterable[V]) -> List[V]:
+        values = list(values)
+        now = monotonic()
+        for value in values:
+            key = self._key(value)
+            self._cache[key] = (value, now)
+            self._cache.move_to_end(key)
+        self._view = None
+        if len(self._cache) > self.max_size:
+            self._delete_oversize()
+        return values
+
     def get(self, index: int = 0) -> Optional[V]:
-        now = time()
-        if -len(self._cache) <= index < len(self._cache):
-            if not self._is_expired(index, now):
-                return self._cache[index]
-            else:
-                self.remove(index)
+        values = self.items()
+        if -len(values) <= index < len(values):
+            return values[index]
+        return None
+
+    def get_by_key(self, key: Any) -> Optional[V]:
+        entry = self._cache.get(key)
+        if entry is not None and not self._is_expired(entry[1]):
+            return entry[0]
         return None
 
     def remove(self, index: int = 0) -> None:
-        if -len(self._cache) <= index < len(self._cache):
-            del self._cache[index]
-            del self._timestamps[index]
+        values = self.items()
+        if -len(values) <= index < len(values):
+            self._cache.pop(self._key(values[index]), None)
+            self._view = None
 
     def clear(self) -> None:
-        self._cache.clear()
-        self._timestamps.clear()
+        self._cache = OrderedDict()
+        self._view = None
 
     def cleanup(self, max_items: int = 50) -> int:
         if self.ttl is None:
             return 0
 
-        now = time()
+        now = monotonic()
         removed = 0
 
-        for i in reversed(range(len(self._cache))):
+        for key, (_, timestamp) in list(self._cache.items()):
             if removed >= max_items:
                 break
-            if self._is_expired(i, now):
-                self.remove(i)
+            if self._is_expired(timestamp, now):
+                del self._cache[key]
                 removed += 1
 
+        if removed:
+            self._view = None
         return removed
 
     def items(self) -> List[V]:
-        now = time()
-        indices_to_remove = [
-            i for i in range(len(self._cache)) if self._is_expired(i, now)
-        ]
-        for i in reversed(indices_to_remove):
-            self.remove(i)
-        return list(self._cache)
+        expired = []
+        if self.ttl is not None:
+            cutoff = monotonic() - self.ttl
+            expired = [k for k, (_, ts) in self._cache.items() if ts < cutoff]
+            for k in expired:
+                del self._cache[k]
+
+        if expired or self._view is None:
+            self._view = [v for v, _ in self._cache.values()]
+            if self._sort is not None:
+                key_func, reverse = self._sort
+                self._view.sort(key=key_func, reverse=(reverse or False))
+        return list(self._view)
 
     def __len__(self) -> int:
         return len(self._cache)
 
     def __contains__(self, value: V) -> bool:
-        for i, v in enumerate(self._cache):
-            if v == value and not self._is_expired(i):
-                return True
-        return False
+        entry = self._cache.get(self._key(value))
+        return entry is not None and not self._is_expired(entry[1])
@@ -45,9 +45,17 @@ class DisplayNameEnum(IntEnum):
 
     @classmethod
     def parse(cls: Type[T], display_name: str) -> T:
-        for member in cls:
-            if member.display_name.lower() == display_name.lower():
-                return member
+        # display name lookup table is built on first parse
+        members = cls.__dict__.get("_display_name_map")
+        if members is None:
+            members = {}
+            for member in cls:
+                members.setdefault(member.display_name.lower(), member)
+            cls._display_name_map = members
+
+        member = members.get(display_name.lower())
+        if member is not None:
+            return member
         raise ValueError(f"Unknown {cls.__name__} display_name: '{display_name}'")
 
     def __eq__(self, other: object) -> bool:
@@ -1,15 +1,33 @@
 from ..exceptions import PRCException, RequestTimeout
 from .cache import Cache, CacheSweeper, KeylessCache
 from dataclasses import dataclass
-from typing import Dict, Optional
+from importlib.util import find_spec
+from typing import Dict, Optional, TYPE_CHECKING
 from time import time
 import asyncio
 import httpx
 
+if TYPE_CHECKING:
+    import aiohttp
+
+# HTTP/2 requires the optional `h2` package (`pip install prc.api[http2]`)
+_http2_available = find_spec("h2") is not None
+
+# JSON responses are parsed with the optional `orjson` package when installed (`pip install prc.api[speed]`)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class CleanAsyncClient(httpx.AsyncClient):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        kwargs.setdefault("http2", _http2_available)
+        kwargs.setdefault(
+            "limits",
+            httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        super().__init__(**kwargs)
 
     def __del__(self):
         try:
@@ -18,6 +36,67 @@ class CleanAsyncClient(httpx.AsyncClient):
             pass
 
 
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """
+    Sends httpx requests through a shared aiohttp session. Requires the optional `aiohttp` package (`pip install prc.api[aiohttp]`).
+    """
+
+    def __init__(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise PRCException(
+                "The aiohttp HTTP backend requires aiohttp: pip install prc.api[aiohttp]"
+            )
+
+        self._aiohttp = aiohttp
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(
+                    limit=100, limit_per_host=30, ttl_dns_cache=300
+                ),
+                auto_decompress=False,
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions.get("timeout", {})
+
+        try:
+            async with self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=request.headers.multi_items(),
+                data=await request.aread(),
+                timeout=self._aiohttp.ClientTimeout(
+                    sock_connect=timeout.get("connect"),
+                    sock_read=timeout.get("read"),
+                ),
+                allow_redirects=False,
+            ) as response:
+                content = await response.read()
+        except (asyncio.TimeoutError, self._aiohttp.ServerTimeoutError) as e:
+            raise httpx.ReadTimeout(str(e), request=request)
+        except self._aiohttp.ClientConnectionError as e:
+            raise httpx.ConnectError(str(e), request=request)
+        except self._aiohttp.ClientError as e:
+            raise httpx.TransportError(str(e), request=request)
+
+        return httpx.Response(
+            response.status,
+            headers=list(response.raw_headers),
+            stream=httpx.ByteStream(content),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+
 @dataclass
 class Bucket:
     name: str
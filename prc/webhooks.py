@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING, Optional, overload
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, overload
 from .exceptions import PRCException
 from .models import *
+from functools import lru_cache
 import re
 
 
@@ -8,6 +9,51 @@ if TYPE_CHECKING:
     from .server import Server
     from .client import PRC
 
+_AUTHOR_RE = re.compile(r"^\[([^\]:]+)(?::(\d+))?]\(.+/users/(\d+)/profile\)")
+_V1_COMMAND_RE = re.compile(r"\"(.+)\"$", flags=re.S)
+_V2_COMMAND_RE = re.compile(r"(kicked|banned|) `(.+)`$", flags=re.S)
+_KICKBAN_TITLE = "kick/ban command usage"
+_JOIN_CODE_PREFIX = "Private Server: "
+_KICKBAN_TYPES = {"kick": WebhookType.KICK, "ban": WebhookType.BAN}
+_VERSIONS: Dict[str, WebhookVersion] = {'"': 1, "`": 2}
+# lowercase title -> type, for every title except v1 kick/ban
+_TITLE_TYPES = {
+    "command usage": WebhookType.COMMAND,
+    "player kicked": WebhookType.KICK,
+    "players kicked": WebhookType.KICK,
+    "player banned": WebhookType.BAN,
+    "players banned": WebhookType.BAN,
+}
+
+
+# Webhook titles are a small, fixed set; None marks the v1 kick/ban title
+@lru_cache(maxsize=16)
+def _get_title_type(title: str) -> Optional[WebhookType]:
+    key = title.lower()
+    if key == _KICKBAN_TITLE:
+        return None
+
+    webhook_type = _TITLE_TYPES.get(key)
+    if webhook_type is None:
+        raise ValueError(f"Unknown webhook title: '{title}'")
+    return webhook_type
+
+
+def _resolve_type(title: str, command_name: Optional["CommandName"]) -> WebhookType:
+    webhook_type = _get_title_type(title)
+    if webhook_type is not None:
+        return webhook_type
+
+    webhook_type = _KICKBAN_TYPES.get(command_name)
+    if webhook_type is not None:
+        return webhook_type
+    if not command_name:
+        raise ValueError(
+            "A v1 kick/ban webhook must have a command name to determine its type."
+        )
+    else:
+        raise ValueError(f"Malformed v1 kick/ban webhook command: {command_name}")
+
 
 class Webhooks:
     """
@@ -19,6 +65,8 @@ class Webhooks:
         The global/shared PRC client.
     """
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: "PRC"):
         self._client = client
 
@@ -36,20 +84,7 @@ class Webhooks:
             The used command's name.
         """
 
-        if title.title() == "Kick/Ban Command Usage":
-            if command_name == "kick":
-                return WebhookType.KICK
-            if command_name == "ban":
-                return WebhookType.BAN
-            if not command_name:
-                raise ValueError(
-                    "A v1 kick/ban webhook must have a command name to determine its type."
-                )
-            else:
-                raise ValueError(
-                    f"Malformed v1 kick/ban webhook command: {command_name}"
-                )
-        return WebhookType.parse(title.replace("Player ", "Players "))
+        return _resolve_type(title, command_name)
 
     def get_author(
         self, *, description: str, server: Optional["Server"] = None
@@ -65,9 +100,7 @@ class Webhooks:
             The server handler, if any.
         """
 
-        if matched := re.search(
-            r"^\[([^\]:]+)(?::(\d+))?]\(.+/users/(\d+)/profile\)", description
-        ):
+        if matched := _AUTHOR_RE.search(description):
             return WebhookPlayer(
                 self._client,
                 (str(matched.group(2) or matched.group(3)), str(matched.group(1))),
@@ -93,10 +126,24 @@ class Webhooks:
             The server handler, if any.
         """
 
+        return self._get_command(
+            description=description,
+            author=author,
+            server=server,
+            version=self._get_version(description=description),
+        )
+
+    def _get_command(
+        self,
+        *,
+        description: str,
+        author: Player,
+        server: Optional["Server"],
+        version: WebhookVersion,
+    ) -> "Command":
         content: str
-        version = self._get_version(description=description)
         if version == 1:
-            if matched := re.search(r"\"(.+)\"$", description, flags=re.S):
+            if matched := _V1_COMMAND_RE.search(description):
                 content = matched.group(1)
             else:
                 raise ValueError(
@@ -104,9 +151,7 @@ class Webhooks:
                 )
 
         elif version == 2:
-            if matched := re.search(
-                r"(kicked|banned|) `(.+)`$", description, flags=re.S
-            ):
+            if matched := _V2_COMMAND_RE.search(description):
                 keyword = matched.group(1)
                 content = matched.group(2)
 
@@ -127,7 +172,7 @@ class Webhooks:
 
         parts = content.split(" ")
         if len(parts) > 1:
-            targets = content.split(" ")[1]
+            targets = parts[1]
             content = content.replace(targets, targets.replace(",", ", ").strip())
 
         return Command(
@@ -148,9 +193,10 @@ class Webhooks:
             The webhook message embed footer.
         """
 
-        if not footer.startswith("Private Server: "):
+        join_code = self._try_get_join_code(footer=footer)
+        if join_code is None:
             raise ValueError(f"Invalid footer format: {footer}")
-        return footer.split(" ")[-1]
+        return join_code
 
     @overload
     def is_valid(self, *, embed: object) -> bool: ...
@@ -236,15 +282,12 @@ class Webhooks:
         if not isinstance(footer, str):
             raise ValueError(f"Invalid or missing title: {footer}")
 
-        server = self._get_server(footer=footer)
-        version = self._get_version(description=description)
-        author = self.get_author(description=description, server=server)
-        command = self.get_command(
-            description=description, author=author, server=server
+        return self._parse(
+            title=title,
+            description=description,
+            join_code=self.get_join_code(footer=footer),
+            version=self._get_version(description=description),
         )
-        type = self.get_type(title=title, command_name=command.name)
-
-        return WebhookMessage(self, type, version, command, author, server)
 
     @overload
     def safe_parse(self, *, embed: object) -> Optional[WebhookMessage]: ...
@@ -286,17 +329,79 @@ class Webhooks:
         except Exception:
             return None
 
-    def _get_server(self, *, footer: str) -> Optional["Server"]:
-        join_code = self.get_join_code(footer=footer)
-        server_id = self._client._global_cache.join_codes.get(join_code)
+    def parse_many(self, embeds: Iterable[object]) -> List[WebhookMessage]:
+        """
+        Parse a batch of webhook messages. Embeds that are not valid webhook messages are skipped.
+
+        Parameters
+        ----------
+        embeds
+            The webhook message embeds. These objects must have the following attributes: "title", "description", "footer.text" (nested).
+        """
+
+        parse = self._parse
+        messages: List[WebhookMessage] = []
+        for embed in embeds:
+            title = getattr(embed, "title", None)
+            description = getattr(embed, "description", None)
+            footer = getattr(getattr(embed, "footer", None), "text", None)
+            if not (
+                isinstance(title, str)
+                and isinstance(description, str)
+                and isinstance(footer, str)
+            ):
+                continue
+
+            # skip malformed embeds without raising
+            join_code = self._try_get_join_code(footer=footer)
+            if join_code is None:
+                continue
+            version = self._try_get_version(description=description)
+            if version is None:
+                continue
+
+            try:
+                messages.append(
+                    parse(
+                        title=title,
+                        description=description,
+                        join_code=join_code,
+                        version=version,
+                    )
+                )
+            except Exception:
+                continue
+        return messages
+
+    def _parse(
+        self, *, title: str, description: str, join_code: str, version: WebhookVersion
+    ) -> WebhookMessage:
+        server = self._get_server(join_code=join_code)
+        author = self.get_author(description=description, server=server)
+        command = self._get_command(
+            description=description, author=author, server=server, version=version
+        )
+        type = self.get_type(title=title, command_name=command.name)
+
+        return WebhookMessage(self, type, version, command, author, server)
+
+    def _get_server(self, *, join_code: str) -> Optional["Server"]:
+        global_cache = self._client._global_cache
+        server_id = global_cache.join_codes.get(join_code)
         if server_id:
-            return self._client._global_cache.servers.get(server_id)
+            return global_cache.servers.get(server_id)
+
+    def _try_get_join_code(self, *, footer: str) -> Optional[str]:
+        if footer.startswith(_JOIN_CODE_PREFIX):
+            return footer[len(_JOIN_CODE_PREFIX) :]
+
+    def _try_get_version(self, *, description: str) -> Optional[WebhookVersion]:
+        return _VERSIONS.get(description[-1:])
 
     def _get_version(self, *, description: str) -> WebhookVersion:
-        if description[-1] == '"':
-            return 1
-        if description[-1] == "`":
-            return 2
+        version = self._try_get_version(description=description)
+        if version is not None:
+            return version
         raise PRCException(f"Unknown webhook message version: '{description}'")
 
         # 'Command Usage' - 17/01/2022 - v1 + v2
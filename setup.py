@@ -25,6 +25,11 @@ setuptools.setup(
     # requirements and search
     python_requires=">=3.8",
     install_requires=["httpx", "asyncio"],
+    extras_require={
+        "http2": ["httpx[http2]"],
+        "aiohttp": ["aiohttp"],
+        "speed": ["orjson"],
+    },
     classifiers=["Framework :: AsyncIO"],
     keywords=["erlc", "ER:LC", "prc", "PRC API"],
 )
@@ -0,0 +1,34 @@
+from prc.utility.cache import Cache, CacheSweeper, KeylessCache
+
+
+def test_keyless_max_size():
+    cache = KeylessCache[int](CacheSweeper(), max_size=3)
+
+    for value in range(5):
+        cache.add(value)
+        assert len(cache) <= 3, f"Keyless cache exceeded max size: {len(cache)}"
+
+    assert 4 in cache and 3 in cache and 2 in cache, "Newest values were evicted"
+    assert 1 not in cache and 0 not in cache, "Oldest values were not evicted"
+
+
+def test_keyless_add_many_max_size():
+    cache = KeylessCache[int](CacheSweeper(), max_size=3)
+    cache.add_many(range(5))
+
+    assert len(cache) == 3, f"Keyless cache exceeded max size: {len(cache)}"
+
+
+def test_max_size():
+    cache = Cache[int, str](CacheSweeper(), max_size=3)
+
+    for key in range(5):
+        cache.set(key, str(key))
+        assert len(cache) <= 3, f"Cache exceeded max size: {len(cache)}"
+
+    assert cache.get(0) is None and cache.get(4) == "4", "Wrong entries were evicted"
+
+
+test_keyless_max_size()
+test_keyless_add_many_max_size()
+test_max_size()
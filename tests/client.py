@@ -0,0 +1,28 @@
+import asyncio
+
+from prc import PRC
+from prc.exceptions import PRCException
+
+
+async def test_http_backends():
+    client = PRC(http_backend="httpx")
+    await client.aclose()
+
+    # aiohttp is an optional dependency
+    try:
+        client = PRC(http_backend="aiohttp")
+    except PRCException:
+        pass
+    else:
+        await client.aclose()
+
+    for backend in ["aiohtp", "requests", "HTTPX", ""]:
+        try:
+            PRC(http_backend=backend)  # type: ignore
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'Invalid HTTP backend "{backend}" was accepted')
+
+
+asyncio.run(test_http_backends())
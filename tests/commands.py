@@ -0,0 +1,52 @@
+from typing import List
+import asyncio
+
+from prc import PRC, PlayerPermission, QueuedPlayer, ServerOwner, VehicleOwner, Server
+
+SERVER_KEY = "abcdefghijkl-" + "a" * 40
+
+
+async def run_command(server: Server, **kwargs) -> str:
+    sent: List[str] = []
+
+    async def _raw(command: str):
+        sent.append(command)
+        return {"message": "Success"}
+
+    server.commands._raw = _raw
+    await server.commands.run(**kwargs)
+
+    assert len(sent) == 1, f"Expected one command to be sent, got {sent}"
+    return sent[0]
+
+
+async def test_target_list():
+    client = PRC(default_server_key=SERVER_KEY)
+    server = client.get_server()
+
+    targets = [
+        "Alice",
+        QueuedPlayer(server, id=5, index=0),
+        ServerOwner(server, id=6, permission=PlayerPermission.OWNER),
+        VehicleOwner(server, name="Bob"),
+    ]
+    command = await run_command(server, name="kick", targets=targets, text="reason")
+    await client.aclose()
+
+    assert command == ":kick Alice,5,6,Bob reason", f"Malformed command: {command}"
+
+
+async def test_single_target():
+    client = PRC(default_server_key=SERVER_KEY)
+    server = client.get_server()
+
+    command = await run_command(
+        server, name="kill", targets=VehicleOwner(server, name="Bob")
+    )
+    await client.aclose()
+
+    assert command == ":kill Bob", f"Malformed command: {command}"
+
+
+asyncio.run(test_target_list())
+asyncio.run(test_single_target())
@@ -0,0 +1,29 @@
+import importlib
+import sys
+
+import prc
+
+
+def test_lazy_models():
+    assert "prc.models" not in sys.modules, "Importing prc eagerly imported models"
+    assert not hasattr(prc, "__version__"), "Unknown attribute did not raise"
+    assert "prc.models" not in sys.modules, "Unknown attribute imported models"
+
+    models = importlib.import_module("prc.models")
+
+    missing = set(models.__all__) - set(prc._MODELS)
+    extra = set(prc._MODELS) - set(models.__all__)
+    assert not missing, f"Models missing from prc._MODELS: {sorted(missing)}"
+    assert not extra, f"Unknown models in prc._MODELS: {sorted(extra)}"
+
+
+def test_exports():
+    names = dir(prc)
+
+    for name in prc.__all__:
+        assert name in names, f'Export "{name}" is not listed by dir(prc)'
+        assert getattr(prc, name) is not None, f'Export "{name}" did not resolve'
+
+
+test_lazy_models()
+test_exports()
@@ -0,0 +1,32 @@
+from prc import PlayerPermission
+
+
+HIERARCHY = [
+    PlayerPermission.NORMAL,
+    PlayerPermission.HELPER,
+    PlayerPermission.MOD,
+    PlayerPermission.ADMIN,
+    PlayerPermission.CO_OWNER,
+    PlayerPermission.OWNER,
+]
+
+
+def test_equal():
+    for permission in PlayerPermission:
+        assert not (permission < permission), f"{permission} < {permission}"
+        assert not (permission > permission), f"{permission} > {permission}"
+        assert permission <= permission, f"{permission} <= {permission} failed"
+        assert permission >= permission, f"{permission} >= {permission} failed"
+
+
+def test_hierarchy():
+    for i, lower in enumerate(HIERARCHY):
+        for higher in HIERARCHY[i + 1 :]:
+            assert lower < higher, f"{lower} < {higher} failed"
+            assert higher > lower, f"{higher} > {lower} failed"
+            assert not (higher < lower), f"{higher} < {lower}"
+            assert not (lower > higher), f"{lower} > {higher}"
+
+
+test_equal()
+test_hierarchy()
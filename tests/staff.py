@@ -0,0 +1,38 @@
+import asyncio
+
+from prc import PRC, PlayerPermission, ServerOwner, ServerStaff
+
+SERVER_KEYS = ["abcdefghijkl-" + "a" * 40, "mnopqrstuvwx-" + "b" * 40]
+
+
+async def test_staff_lists():
+    client = PRC()
+    server = client.get_server(SERVER_KEYS[0])
+    server.owner = ServerOwner(server, id=1, permission=PlayerPermission.OWNER)
+
+    staff = ServerStaff(
+        server,
+        data={"Admins": {"2": "Alice"}, "Mods": {"3": "Bob"}, "Helpers": {"4": "Carl"}},
+    )
+    await client.aclose()
+
+    assert [m.id for m in server.admins] == [2], f"Wrong admins: {server.admins}"
+    assert [m.id for m in server.mods] == [3], f"Wrong mods: {server.mods}"
+    assert [m.id for m in server.helpers] == [4], f"Wrong helpers: {server.helpers}"
+    assert staff.count() == 4, f"Wrong staff count: {staff.count()}"
+
+
+async def test_separate_servers():
+    client = PRC()
+    server, other = [client.get_server(key) for key in SERVER_KEYS]
+    await client.aclose()
+
+    assert server is not other, "Servers are the same handler"
+    for attr in ["co_owners", "admins", "mods", "helpers"]:
+        assert getattr(server, attr) is not getattr(
+            other, attr
+        ), f"Servers share their {attr} list"
+
+
+asyncio.run(test_staff_lists())
+asyncio.run(test_separate_servers())
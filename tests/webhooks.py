@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+import asyncio
+
+from prc import PRC, WebhookType
+
+FOOTER = "Private Server: abcde"
+V1_KICK = '[Alice:1](https://www.roblox.com/users/1/profile) used the command: ":kick Bob rule breaking"'
+V2_KICK = (
+    "[Alice](https://www.roblox.com/users/1/profile) kicked `Bob - Player Not In Game`"
+)
+V2_COMMAND = "[Alice](https://www.roblox.com/users/1/profile) used the command `:h hi`"
+
+
+def embed(title, description, footer=FOOTER):
+    return SimpleNamespace(
+        title=title, description=description, footer=SimpleNamespace(text=footer)
+    )
+
+
+async def test_parse_many():
+    client = PRC()
+
+    valid = [
+        embed("Kick/Ban Command Usage", V1_KICK),
+        embed("Player Kicked", V2_KICK),
+        embed("Command Usage", V2_COMMAND),
+    ]
+    malformed = [
+        embed("Command Usage", V2_COMMAND, footer="Public Server: abcde"),
+        embed("Command Usage", V2_COMMAND + "."),
+        embed("Command Usage", ""),
+        embed("Unknown Title", V2_COMMAND),
+        embed("Command Usage", "no author `:h hi`"),
+        embed(None, V2_COMMAND),
+        SimpleNamespace(title="Command Usage", description=V2_COMMAND),
+        object(),
+    ]
+
+    messages = client.webhooks.parse_many([malformed[0], *valid, *malformed[1:]])
+    await client.aclose()
+
+    assert [m.type for m in messages] == [
+        WebhookType.KICK,
+        WebhookType.KICK,
+        WebhookType.COMMAND,
+    ], f"Wrong parsed messages: {messages}"
+    assert [m.version for m in messages] == [1, 2, 2], "Wrong webhook versions"
+
+    for message, e in zip(messages, valid):
+        parsed = client.webhooks.parse(embed=e)
+        assert (
+            message.command.full_content == parsed.command.full_content
+        ), f"parse_many and parse disagree: {message.command} != {parsed.command}"
+
+
+asyncio.run(test_parse_many())